@@ -10,6 +10,7 @@ setup(
         "numpy",
         "scipy",
         "pandas",
+        "pyyaml",
     ],
     include_package_data=True,
 )
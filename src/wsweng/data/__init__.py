@@ -1,9 +1,12 @@
 import pandas as pd
+import yaml
 from pathlib import Path
+from typing import Any
 
 __all__ = (
     "DATA_PATH",
     "load_csv",
+    "load_yaml",
 )
 
 DATA_PATH = Path(__file__).parent
@@ -12,3 +15,9 @@ DATA_PATH = Path(__file__).parent
 def load_csv(file_name: str) -> pd.DataFrame:
     file_path = DATA_PATH.joinpath(file_name)
     return pd.read_csv(file_path, delimiter=",", index_col=0, na_values="")
+
+
+def load_yaml(file_name: str) -> dict[str, Any]:
+    file_path = DATA_PATH.joinpath(file_name)
+    with open(file_path) as f:
+        return yaml.safe_load(f)
@@ -3,3 +3,19 @@ from .dowel_factory import Dowels
 
 # Factories
 from .bolt_factory import wood_bolt
+
+# Batch evaluation
+from .batch import evaluate, evaluate_to_store, precision_report
+from .results import ResultStore
+
+# Layout
+from .layout import Member, LayoutCheck, check_layout
+
+# Capacity lookup
+from .capacity_index import CapacityIndex
+
+# Multi-member connections
+from .connection import Ply, Connection, evaluate_connections
+
+# Steel
+from .steel import steel_check, steel_grade
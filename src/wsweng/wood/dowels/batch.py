@@ -0,0 +1,354 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, product
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .wood_dowel import WoodDowel
+from .dowel_factory import Dowels
+from .results import ResultStore
+
+# Yield modes in the order they are stored and reported.
+MODES = ("Im", "Is", "II", "IIIm", "IIIs", "IV")
+
+# Columns produced by `evaluate`, mapped to their dtype.
+SCHEMA = {
+    "d": "<f8",
+    "dr": "<f8",
+    "gm": "<f8",
+    "gs": "<f8",
+    "fyb": "<f8",
+    "lm": "<f8",
+    "ls": "<f8",
+    "fe_main": "<f8",
+    "fe_side": "<f8",
+    "full_diameter": "|b1",
+    "double_shear": "|b1",
+    "theta": "<f8",
+    "zim": "<f8",
+    "zis": "<f8",
+    "zii": "<f8",
+    "ziiim": "<f8",
+    "ziiis": "<f8",
+    "ziv": "<f8",
+    "mode": "|i1",
+    "zv": "<f8",
+}
+
+
+def schema(dtype: np.dtype = np.float64) -> dict[str, str]:
+    """ `SCHEMA` with floating point columns stored as `dtype`.
+
+    Parameters
+    ----------
+    dtype : np.dtype, optional
+        ``np.float64`` or ``np.float32``, by default ``np.float64``.
+
+    Returns
+    -------
+    dict[str, str]
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    return {
+        name: dtype.str if np.dtype(value).kind == "f" else value
+        for name, value in SCHEMA.items()
+    }
+
+
+_INPUTS = (
+    "d", "dr", "gm", "gs", "fyb", "lm", "ls",
+    "fe_main", "fe_side", "full_diameter", "double_shear",
+)
+_OUTPUTS = ("zim", "zis", "zii", "ziiim", "ziiis", "ziv")
+
+
+def dowel_arrays(dowels: Iterable[WoodDowel]) -> dict[str, np.ndarray]:
+    """ Collect dowel attributes into one array per attribute.
+
+    Parameters
+    ----------
+    dowels : Iterable[WoodDowel]
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Keyed by attribute name. Missing bearing strengths are `nan`.
+    """
+    dowels = list(dowels)
+    ret = {}
+    for name in _INPUTS:
+        dtype = np.dtype(SCHEMA[name])
+        values = [getattr(dowel, name) for dowel in dowels]
+        if dtype.kind == "f":
+            values = [np.nan if v is None else v for v in values]
+        ret[name] = np.asarray(values, dtype=dtype)
+    return ret
+
+
+def yield_modes(
+    d: np.ndarray,
+    dr: np.ndarray,
+    gm: np.ndarray,
+    gs: np.ndarray,
+    fyb: np.ndarray,
+    lm: np.ndarray,
+    ls: np.ndarray,
+    fe_main: np.ndarray,
+    fe_side: np.ndarray,
+    full_diameter: np.ndarray,
+    double_shear: np.ndarray,
+    theta: np.ndarray,
+) -> np.ndarray:
+    """ Vectorized form of the `WoodDowel` yield mode equations.
+
+    All arguments are broadcast against each other. Missing bearing strengths
+    are passed as `nan`.
+
+    Returns
+    -------
+    np.ndarray
+        Shape ``(6, n)`` in the order of `MODES`. For double shear, the
+        modes are the per-connection values used by `WoodDowel.Zv`
+        (`Is`, `IIIs` and `IV` doubled), and `II` and `IIIm` are `nan`.
+    """
+    d, dr, gm, gs, fyb, lm, ls, fe_main, fe_side, full_diameter, double_shear, theta = (
+        np.broadcast_arrays(d, dr, gm, gs, fyb, lm, ls, fe_main, fe_side,
+                            full_diameter, double_shear, theta)
+    )
+    rtheta = np.radians(theta)
+    sin2, cos2 = np.sin(rtheta)**2, np.cos(rtheta)**2
+    sqrt_d = np.sqrt(d)
+
+    def fe(g: np.ndarray) -> np.ndarray:
+        fe_ii = 11200.0*g
+        fe_t = (6100.0*(g**1.45))/sqrt_d
+        return np.where(
+            d < 0.25,
+            16600.0*(g**1.84),
+            fe_ii*fe_t/(fe_ii*sin2 + fe_t*cos2),
+        )
+
+    fem = np.where(np.isnan(fe_main), fe(gm), fe_main)
+    fes = np.where(np.isnan(fe_side), fe(gs), fe_side)
+    re = fem/fes
+    rt = lm/ls
+
+    de = np.where(full_diameter, d, dr)
+    de2 = de**2
+    kd = np.where(de <= 0.17, 2.2, 10.0*de + 0.5)
+    ktheta = 1.0 + 0.25*(theta/90)
+    small = de < 0.25
+    rd_4 = np.where(small, kd, 4.0*ktheta)
+    rd_36 = np.where(small, kd, 3.6*ktheta)
+    rd_32 = np.where(small, kd, 3.2*ktheta)
+
+    k1 = (
+        (np.sqrt(re + 2*(re**2)*(1 + rt + rt**2) + (rt**2)*(re**3)) - re*(1 + rt)) /
+        (1 + re)
+    )
+    k2 = np.sqrt(2*(1 + re) + (2*fyb*(1 + 2*re)*de2)/(3*fem*(lm**2))) - 1
+    k3 = np.sqrt(2*(1 + re)/re + (2*fyb*(2 + re)*de2)/(3*fem*(ls**2))) - 1
+
+    modes = np.empty((len(MODES), d.size), dtype=np.result_type(d, 1.0))
+    modes[0] = de*lm*fem/rd_4
+    modes[1] = de*ls*fes/rd_4
+    modes[2] = k1*de*ls*fes/rd_36
+    modes[3] = (k2*de*lm*fem)/((1 + 2*re)*rd_32)
+    modes[4] = (k3*de*ls*fem)/((2 + re)*rd_32)
+    modes[5] = np.sqrt((2*fem*fyb)/(3*(1 + re)))*de2/rd_32
+
+    # Double shear: side member modes act on both sides, II and IIIm do not apply.
+    modes[[1, 4, 5]] *= np.where(double_shear, 2, 1).astype(modes.dtype)
+    modes[[2, 3]] = np.where(double_shear, np.nan, modes[[2, 3]])
+    return modes
+
+
+def evaluate(
+    dowels: Iterable[WoodDowel],
+    theta: float | Iterable[float] = 90.0,
+    *,
+    workers: int = 1,
+    chunk_size: int = 65_536,
+    dtype: np.dtype = np.float64,
+) -> dict[str, np.ndarray]:
+    """ Evaluate the capacity of many dowels at once.
+
+    Parameters
+    ----------
+    dowels : Iterable[WoodDowel]
+    theta : float | Iterable[float], optional
+        Angle(s) of dowel load relative to grain, by default 90.0. Each dowel
+        is evaluated at every angle.
+    workers : int, optional
+        Number of threads to solve with, by default 1. The numpy kernels
+        release the GIL, so rows split into chunks solve in parallel.
+    chunk_size : int, optional
+        Rows per chunk when ``workers > 1``, by default 65,536.
+    dtype : np.dtype, optional
+        Floating point type to compute and return in, by default
+        ``np.float64``. ``np.float32`` halves memory for large sweeps, see
+        `precision_report` for the accuracy cost.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        One row per dowel and angle (dowel major), with the columns in
+        `schema(dtype)`. ``mode`` indexes `MODES` for the governing mode and ``zv``
+        matches `WoodDowel.Zv`.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+    columns = schema(dtype)
+    inputs = dowel_arrays(dowels)
+    thetas = np.atleast_1d(np.asarray(theta, dtype=columns["theta"]))
+    n_dowels, n_theta = len(inputs["d"]), len(thetas)
+
+    ret = {
+        name: np.repeat(values.astype(columns[name], copy=False), n_theta)
+        for name, values in inputs.items()
+    }
+    ret["theta"] = np.tile(thetas, n_dowels)
+    n_rows = n_dowels*n_theta
+    for name in (*_OUTPUTS, "mode", "zv"):
+        ret[name] = np.empty(n_rows, dtype=columns[name])
+
+    if workers <= 1:
+        _solve(ret, slice(None))
+    else:
+        chunks = [slice(i, i + chunk_size) for i in range(0, n_rows, chunk_size)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Chunks write to disjoint slices of the outputs.
+            list(pool.map(lambda chunk: _solve(ret, chunk), chunks))
+    return ret
+
+
+def _solve(columns: dict[str, np.ndarray], rows: slice) -> None:
+    """ Fill the output columns for `rows` in place.
+    """
+    modes = yield_modes(**{name: columns[name][rows] for name in (*_INPUTS, "theta")})
+    for name, values in zip(_OUTPUTS, modes):
+        columns[name][rows] = values
+    mode = np.argmin(np.where(np.isnan(modes), np.inf, modes), axis=0)
+    columns["mode"][rows] = mode
+    columns["zv"][rows] = np.take_along_axis(modes, mode[None, :], axis=0)[0]
+
+
+def evaluate_to_store(
+    dowels: Iterable[WoodDowel],
+    path: str,
+    theta: float | Iterable[float] = 90.0,
+    *,
+    chunk_size: int = 100_000,
+    workers: int = 1,
+    dtype: np.dtype = np.float64,
+) -> ResultStore:
+    """ Evaluate dowels in chunks, appending each chunk to a result store.
+
+    Parameters
+    ----------
+    dowels : Iterable[WoodDowel]
+        May be a generator; only `chunk_size` dowels are held at once.
+    path : str
+        Store directory. Created if it does not exist, appended to if it does.
+    theta : float | Iterable[float], optional
+        Angle(s) of dowel load relative to grain, by default 90.0.
+    chunk_size : int, optional
+        Number of dowels per chunk, by default 100,000.
+    workers : int, optional
+        Threads used to solve each chunk, see `evaluate`. By default 1.
+    dtype : np.dtype, optional
+        Floating point type to compute and store in, see `evaluate`. Must
+        match the store if appending. By default ``np.float64``.
+
+    Returns
+    -------
+    ResultStore
+    """
+    store = ResultStore(path, schema=schema(dtype), labels={"mode": MODES})
+    dowels = iter(dowels)
+    while chunk := list(islice(dowels, chunk_size)):
+        store.append(evaluate(chunk, theta, workers=workers, dtype=dtype))
+    return store
+
+
+def precision_report(
+    thicknesses: Iterable[float] = (0.25, 0.5, 1.5, 2.5, 3.5, 5.5, 7.25, 11.25),
+    angles: Iterable[float] = tuple(range(0, 91, 5)),
+    materials: Iterable[str | tuple[str, str]] = ("DFL", ("DFL", "A36")),
+    dtype: np.dtype = np.float32,
+) -> dict[str, Any]:
+    """ Accuracy of reduced precision `evaluate` against the scalar `Zv`.
+
+    Every catalog bolt is evaluated in single and double shear over all main
+    and side thicknesses, materials and angles, once with `dtype` and once
+    with `WoodDowel.Zv` in double precision.
+
+    Parameters
+    ----------
+    thicknesses : Iterable[float], optional
+        Main and side member thicknesses.
+    angles : Iterable[float], optional
+        Load angles relative to grain, by default 0 to 90 in 5 degree steps.
+    materials : Iterable[str | (str, str)], optional
+        Material specifiers, as passed to `Dowels.bolt`.
+    dtype : np.dtype, optional
+        By default ``np.float32``.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``points`` evaluated, ``max_rel_error`` and ``mean_rel_error`` of
+        `zv`, and ``mode_mismatches``, the number of points where the
+        governing mode differs (only where two modes are within rounding
+        of each other). The breakdown is in ``rows``, a DataFrame with one
+        row per point (``d``, ``lm``, ``ls``, ``material``, ``double_shear``,
+        ``theta``, ``zv``, ``rel_error`` and ``mode_mismatch``), and
+        ``by_group``, its ``max_rel_error``, ``mean_rel_error`` and
+        ``mode_mismatches`` grouped by diameter, thicknesses and shear.
+    """
+    thicknesses, angles = tuple(thicknesses), tuple(angles)
+    catalog = Dowels._catalog()
+    configs = list(product(
+        catalog["D"], thicknesses, thicknesses, materials, (False, True)
+    ))
+    dowels = [
+        Dowels.bolt(d, tm=tm, ts=ts, material=material, double_shear=double_shear)
+        for d, tm, ts, material, double_shear in configs
+    ]
+    reduced = evaluate(dowels, angles, dtype=dtype)
+    full = evaluate(dowels, angles)
+    exact = np.asarray([dowel.Zv(theta) for dowel in dowels for theta in angles])
+
+    rel_error = np.abs(reduced["zv"].astype(np.float64) - exact)/exact
+    mode_mismatch = reduced["mode"] != full["mode"]
+    material = np.repeat(
+        ["/".join(m) if not isinstance(m, str) else m for *_, m, _ in configs],
+        len(angles),
+    )
+    rows = pd.DataFrame({
+        "d": full["d"],
+        "lm": full["lm"],
+        "ls": full["ls"],
+        "material": material,
+        "double_shear": full["double_shear"],
+        "theta": full["theta"],
+        "zv": exact,
+        "rel_error": rel_error,
+        "mode_mismatch": mode_mismatch,
+    })
+    by_group = rows.groupby(["d", "lm", "ls", "double_shear"]).agg(
+        max_rel_error=("rel_error", "max"),
+        mean_rel_error=("rel_error", "mean"),
+        mode_mismatches=("mode_mismatch", "sum"),
+    )
+    return {
+        "points": len(exact),
+        "max_rel_error": float(rel_error.max()),
+        "mean_rel_error": float(rel_error.mean()),
+        "mode_mismatches": int(np.count_nonzero(mode_mismatch)),
+        "rows": rows,
+        "by_group": by_group,
+    }
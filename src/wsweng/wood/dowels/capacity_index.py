@@ -0,0 +1,176 @@
+from itertools import product
+from typing import Iterable, Mapping
+import threading
+
+import numpy as np
+
+from . import dowel_factory
+from .dowel_factory import Dowels
+from .batch import evaluate
+
+# Standard member thicknesses, steel plate and dressed lumber.
+_THICKNESSES = (0.25, 0.375, 0.50, 1.50, 2.50, 3.50, 5.50, 7.25)
+_ANGLES = (0.0, 15.0, 30.0, 45.0, 60.0, 75.0, 90.0)
+_MATERIAL_PAIRS = (("DFL", "DFL"), ("DFL", "A36"))
+_SORT_KEYS = ("d", "cost", "zv")
+
+
+def _key(tm: float, ts: float, main: str, side: str, theta: float) -> tuple:
+    return (round(tm, 4), round(ts, 4), main, side, round(theta, 4))
+
+
+class CapacityIndex:
+    """ Precomputed bolt capacities for fast demand queries.
+
+    Every catalog bolt is evaluated in single and double shear over a grid of
+    member thicknesses, material pairs and angles. For each member pair and
+    angle the entries are kept sorted by `Zv`, so finding all that meet a
+    demand is a binary search.
+
+    The index is rebuilt on the next query if the bolt catalog file or the
+    material table changes.
+
+    Parameters
+    ----------
+    thicknesses : Iterable[float], optional
+        Grid of main and side member thicknesses.
+    materials : Iterable[(str, str)], optional
+        (main, side) material pairs, by default DFL/DFL and DFL/A36.
+    angles : Iterable[float], optional
+        Load angles relative to grain, by default 0 to 90 in 15 degree steps.
+    cost : Mapping[str, float], optional
+        Cost per bolt, keyed by catalog ID (e.g. ``"0.5000"``). Required to
+        sort query results by cost.
+    """
+
+    def __init__(
+        self,
+        thicknesses: Iterable[float] = _THICKNESSES,
+        materials: Iterable[tuple[str, str]] = _MATERIAL_PAIRS,
+        angles: Iterable[float] = _ANGLES,
+        cost: Mapping[str, float] = None,
+    ) -> None:
+        self.thicknesses = tuple(thicknesses)
+        self.materials = tuple(tuple(pair) for pair in materials)
+        self.angles = tuple(angles)
+        self.cost = dict(cost) if cost is not None else None
+        self._lock = threading.Lock()
+        # (stamp, groups, columns), replaced as a whole on rebuild.
+        self._state = None
+        self._build()
+
+    def query(
+        self,
+        demand: float,
+        *,
+        tm: float,
+        ts: float,
+        material: str | tuple[str, str] = "DFL",
+        theta: float = 90.0,
+        sort: str = "d",
+    ) -> dict[str, np.ndarray]:
+        """ All catalog bolts and shear configurations with ``Zv >= demand``.
+
+        Parameters
+        ----------
+        demand : float
+            Required reference shear capacity.
+        tm, ts : float
+            Main and side member thickness, must be on the index grid.
+        material : str | (str, str), optional
+            As in `Dowels.bolt`, by default `DFL`.
+        theta : float, optional
+            Angle of load relative to grain, must be on the index grid. By
+            default 90.0.
+        sort : str, optional
+            ``"d"`` to sort by diameter, ``"cost"`` by cost or ``"zv"`` by
+            capacity, ascending. By default ``"d"``.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Columns ``id``, ``name``, ``d``, ``double_shear``, ``zv`` and
+            ``cost`` (`nan` if no costs were given).
+        """
+        if sort not in _SORT_KEYS:
+            raise ValueError(f"sort must be one of {_SORT_KEYS}, got {sort!r}.")
+        if sort == "cost" and self.cost is None:
+            raise ValueError("No costs were given to sort by.")
+
+        # Read the state once so a concurrent rebuild cannot mix two builds.
+        state = self._state
+        if state[0] != self._fingerprint():
+            self._build()
+            state = self._state
+        _, groups, columns = state
+
+        main, side = (material, material) if isinstance(material, str) else material
+        key = _key(tm, ts, main, side, theta)
+        try:
+            neg_zv, rows = groups[key]
+        except KeyError:
+            raise KeyError(f"{key} is not on the index grid.") from None
+
+        rows = rows[:np.searchsorted(neg_zv, -demand, side="right")]
+        rows = rows[np.argsort(columns[sort][rows], kind="stable")]
+        return {name: values[rows] for name, values in columns.items()}
+
+    # =========================
+    # =   PROTECTED METHODS   =
+    # =========================
+
+    @staticmethod
+    def _fingerprint() -> tuple:
+        """ Changes whenever the bolt catalog file or material table does.
+        """
+        return (*dowel_factory._bolts_stamp(), repr(dowel_factory._MATERIALS))
+
+    def _build(self) -> None:
+        with self._lock:
+            stamp = self._fingerprint()
+            if self._state is not None and stamp == self._state[0]:
+                return
+
+            # The class level catalog may predate this index, reload it if it
+            # was read from an older file.
+            bolts = Dowels._catalog(reload=Dowels._bolts_stamp != stamp[:2])
+            configs = list(product(
+                bolts.index, self.thicknesses, self.thicknesses,
+                self.materials, (False, True),
+            ))
+            dowels = [
+                Dowels.bolt(bolts.loc[bolt_id, "D"], tm=tm, ts=ts,
+                            material=pair, double_shear=double_shear)
+                for bolt_id, tm, ts, pair, double_shear in configs
+            ]
+            results = evaluate(dowels, self.angles)
+
+            n_angles = len(self.angles)
+            ids = np.repeat(np.asarray([c[0] for c in configs], dtype=object), n_angles)
+            cost = self.cost or {}
+            columns = {
+                "id": ids,
+                "name": np.asarray([bolts.loc[i, "NAME"] for i in ids], dtype=object),
+                "d": results["d"],
+                "double_shear": results["double_shear"],
+                "zv": results["zv"],
+                "cost": np.asarray([cost.get(i, np.nan) for i in ids], dtype=float),
+            }
+
+            # Group rows by member pair and angle, each sorted by Zv descending.
+            keys = [
+                _key(tm, ts, main, side, theta)
+                for _, tm, ts, (main, side), _ in configs
+                for theta in self.angles
+            ]
+            groups = {}
+            for row, key in enumerate(keys):
+                groups.setdefault(key, []).append(row)
+            for key, rows in groups.items():
+                rows = np.asarray(rows)
+                rows = rows[np.argsort(-columns["zv"][rows], kind="stable")]
+                groups[key] = (-columns["zv"][rows], rows)
+
+            for values in columns.values():
+                values.flags.writeable = False
+            self._state = (stamp, groups, columns)
@@ -0,0 +1,235 @@
+from dataclasses import dataclass, KW_ONLY
+from functools import cached_property
+from typing import Iterable
+
+import numpy as np
+
+from .wood_dowel import WoodDowel
+from .dowel_factory import Dowels
+from .batch import evaluate
+
+
+@dataclass(frozen=True)
+class Ply:
+    """ One member in a connection stack.
+
+    Attributes
+    ----------
+    t : float
+        Member thickness.
+    material : str
+        Material specifier, as passed to the `Dowels` factories. Defaults to `DFL`.
+    """
+    t: float
+    _: KW_ONLY
+    material: str = "DFL"
+
+
+@dataclass(frozen=True)
+class Connection:
+    """ A dowel through a stack of two or more members.
+
+    Two and three member stacks are the single and double shear connections
+    of `WoodDowel`. A three member stack uses the middle ply as the main
+    member; if the outer plies differ, it is evaluated once with each as the
+    side member and the lower value is used.
+
+    For four or more members, each shear plane, between adjacent plies, is
+    evaluated as a single shear connection and the connection capacity is
+    the lowest plane capacity times the number of planes (NDS 12.3.8). NDS
+    does not say what thickness to use for a member loaded on both faces.
+    Here outer plies use their full thickness and interior plies half their
+    thickness on each plane, following the double shear mode Im equation,
+    where the full main member thickness resists both planes.
+
+    REF: NDS, 2015 - 12.3.8
+
+    Attributes
+    ----------
+    dowel : WoodDowel
+        Fastener. Only its fastener properties (`d`, `dr`, `fyb`,
+        `full_diameter`) are used; member properties come from `plies`.
+    plies : tuple[Ply, ...]
+        Members in stack order.
+    """
+    dowel: WoodDowel
+    plies: tuple[Ply, ...]
+
+    def __post_init__(self) -> None:
+        if len(self.plies) < 2:
+            raise ValueError("A connection needs at least two plies.")
+        object.__setattr__(self, "plies", tuple(self.plies))
+
+    @classmethod
+    def bolt(
+        cls,
+        d: float,
+        plies: Iterable[Ply],
+        *,
+        full_diameter: bool = False,
+    ) -> "Connection":
+        """ Create a connection with a catalog bolt.
+
+        Parameters
+        ----------
+        d : float
+            Nominal bolt diameter.
+        plies : Iterable[Ply]
+            Members in stack order.
+        full_diameter : bool, optional
+            By default `False`.
+
+        Returns
+        -------
+        Connection
+        """
+        plies = tuple(plies)
+        dowel = Dowels.bolt(d, tm=plies[0].t, ts=plies[-1].t, full_diameter=full_diameter)
+        return cls(dowel, plies)
+
+    @property
+    def n_planes(self) -> int:
+        return len(self.plies) - 1
+
+    @property
+    def multiplier(self) -> int:
+        """ Factor applied to the lowest `Zv` of `dowels`.
+
+        One for two and three member stacks, whose `dowels` already cover
+        the whole connection, otherwise the number of shear planes.
+        """
+        return 1 if len(self.plies) <= 3 else self.n_planes
+
+    @cached_property
+    def dowels(self) -> tuple[WoodDowel, ...]:
+        """ `WoodDowel` models evaluated for the connection.
+
+        The single shear dowel for two plies, the double shear dowel(s) for
+        three, or one single shear dowel per shear plane for four or more.
+        """
+        plies = self.plies
+        if len(plies) == 2:
+            return (self._derive(plies[0], plies[1], plies[0].t, plies[1].t),)
+
+        if len(plies) == 3:
+            main = plies[1]
+            sides = (plies[0],) if plies[0] == plies[2] else (plies[0], plies[2])
+            return tuple(
+                self._derive(main, side, main.t, side.t, double_shear=True)
+                for side in sides
+            )
+
+        n = len(plies)
+        lengths = [
+            ply.t if i in (0, n - 1) else ply.t/2.0
+            for i, ply in enumerate(plies)
+        ]
+        return tuple(
+            self._derive(plies[i], plies[i + 1], lengths[i], lengths[i + 1])
+            for i in range(self.n_planes)
+        )
+
+    def Zv(self, theta: float = 90.0) -> float:
+        """ Reference connection shear capacity.
+
+        Parameters
+        ----------
+        theta : float, optional
+            Angle of dowel load relative to grain, by default 90.0
+
+        Returns
+        -------
+        float
+        """
+        return self.multiplier*min(dowel.Zv(theta) for dowel in self.dowels)
+
+    # =========================
+    # =   PROTECTED METHODS   =
+    # =========================
+
+    def _derive(
+        self,
+        main: Ply,
+        side: Ply,
+        lm: float,
+        ls: float,
+        double_shear: bool = False,
+    ) -> WoodDowel:
+        mat_data = Dowels._parse_materials((main.material, side.material))
+        return self.dowel.derive(
+            lm=lm,
+            ls=ls,
+            gm=mat_data["MAIN"]["G"],
+            gs=mat_data["SIDE"]["G"],
+            fe_main=mat_data["MAIN"]["FE"],
+            fe_side=mat_data["SIDE"]["FE"],
+            double_shear=double_shear,
+        )
+
+
+def evaluate_connections(
+    connections: Iterable[Connection],
+    theta: float | Iterable[float] = 90.0,
+) -> dict[str, np.ndarray]:
+    """ Evaluate many connections at once.
+
+    The `dowels` of all connections are evaluated in a single call to
+    `batch.evaluate`, then reduced to the governing dowel of each connection.
+
+    Parameters
+    ----------
+    connections : Iterable[Connection]
+    theta : float | Iterable[float], optional
+        Angle(s) of dowel load relative to grain, by default 90.0.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        One row per connection and angle (connection major), with columns
+        ``theta``, ``n_planes``, ``dowel`` (index into `Connection.dowels` of
+        the governing model, the shear plane for four or more members),
+        ``mode`` (index into `MODES` for that model) and ``zv``, matching
+        `Connection.Zv`.
+    """
+    connections = list(connections)
+    thetas = np.atleast_1d(np.asarray(theta, dtype=float))
+    n_theta = len(thetas)
+    if not connections:
+        return {
+            "theta": np.empty(0, dtype=float),
+            "n_planes": np.empty(0, dtype=np.int64),
+            "dowel": np.empty(0, dtype=np.int64),
+            "mode": np.empty(0, dtype=np.int8),
+            "zv": np.empty(0, dtype=float),
+        }
+
+    n_planes = np.asarray([c.n_planes for c in connections], dtype=np.int64)
+    multiplier = np.asarray([c.multiplier for c in connections], dtype=float)
+    n_dowels = np.asarray([len(c.dowels) for c in connections], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(n_dowels)[:-1]))
+    results = evaluate(
+        (dowel for c in connections for dowel in c.dowels),
+        thetas,
+    )
+
+    # Rows are (dowel, theta), reshape so dowels run down axis 0.
+    zv = results["zv"].reshape(-1, n_theta)
+    mode = results["mode"].reshape(-1, n_theta)
+    zv_min = np.minimum.reduceat(zv, offsets, axis=0)
+
+    # First dowel in each connection that attains the minimum.
+    owner = np.repeat(np.arange(len(connections)), n_dowels)
+    local = np.arange(len(owner)) - offsets[owner]
+    is_min = zv == zv_min[owner]
+    governing_dowel = np.minimum.reduceat(
+        np.where(is_min, local[:, None], np.iinfo(np.int64).max), offsets, axis=0
+    )
+    governing = (offsets[:, None] + governing_dowel, np.arange(n_theta)[None, :])
+
+    return {
+        "theta": np.tile(thetas, len(connections)),
+        "n_planes": np.repeat(n_planes, n_theta),
+        "dowel": governing_dowel.ravel(),
+        "mode": mode[governing].ravel(),
+        "zv": (zv_min*multiplier[:, None]).ravel(),
+    }
@@ -1,7 +1,8 @@
 import pandas as pd
+import threading
 from typing import Any
 
-from wsweng.data import load_csv
+from wsweng.data import DATA_PATH, load_csv
 
 from .wood_dowel import WoodDowel
 
@@ -33,6 +34,13 @@ def _load_bolts() -> pd.DataFrame:
     return data
 
 
+def _bolts_stamp() -> tuple[int, int]:
+    """ Modification time and size of the bolt catalog file.
+    """
+    stat = DATA_PATH.joinpath("bolts.csv").stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 _ALIAS = {
     "A36": {"STEEL"},
 }
@@ -45,6 +53,9 @@ class Dowels:
     """Factory for creating dowels.
     """
     _bolts: pd.DataFrame = None
+    # `_bolts_stamp()` of the file `_bolts` was loaded from.
+    _bolts_stamp: tuple[int, int] = None
+    _lock = threading.Lock()
 
     def __new__(
         cls,
@@ -139,14 +150,10 @@ class Dowels:
         -------
         WoodDowel
         """
-
-        if Dowels._bolts is None:
-            Dowels._bolts = _load_bolts()
-
         # Bolt Properties
         # TODO: This should have fail-safe behavior if diameter is not found. Next lowest?
         # For now, just assert the value is in the list.
-        bolt_data: pd.Series = Dowels._bolts.loc[f"{d:#.4f}"]
+        bolt_data: pd.Series = Dowels._catalog().loc[f"{d:#.4f}"]
         mat_data = Dowels._parse_materials(material)
 
         # Create dowel.
@@ -168,6 +175,31 @@ class Dowels:
     # =   PROTECTED METHODS   =
     # =========================
 
+    @classmethod
+    def _catalog(cls, reload: bool = False) -> pd.DataFrame:
+        """ Bolt catalog, loaded once on first use.
+
+        Safe to call from multiple threads; only the first caller loads the
+        catalog and the rest wait for it. Pass `reload` to re-read the file.
+        """
+        if reload:
+            with cls._lock:
+                cls._load()
+        elif cls._bolts is None:
+            with cls._lock:
+                if cls._bolts is None:
+                    cls._load()
+        return cls._bolts
+
+    @classmethod
+    def _load(cls) -> None:
+        """ Read the catalog and record the file it came from. Call with
+        `_lock` held.
+        """
+        # Stamped first, so a file changed while loading reads as stale.
+        cls._bolts_stamp = _bolts_stamp()
+        cls._bolts = _load_bolts()
+
     @staticmethod
     def _parse_materials(
         material: str | tuple[str, str]
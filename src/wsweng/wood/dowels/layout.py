@@ -0,0 +1,254 @@
+from dataclasses import dataclass, field, KW_ONLY
+import math
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .wood_dowel import WoodDowel
+
+# Tolerance for grouping fasteners into rows, as a fraction of diameter.
+_ROW_TOL = 0.01
+
+
+@dataclass(frozen=True)
+class Member:
+    """ Geometry of the wood member a fastener pattern is placed in.
+
+    Fastener coordinates are ``(x, y)`` with `x` parallel to grain and `y`
+    perpendicular to grain. The member spans ``0 <= y <= width``.
+
+    Attributes
+    ----------
+    width : float
+        Member width perpendicular to grain.
+    end : float
+        `x` coordinate of the member end, fasteners lie at ``x > end``.
+        Defaults to 0.0.
+    length : float | None
+        Member length from `end`. If given, the far end is also checked.
+    """
+    width: float
+    _: KW_ONLY
+    end: float = 0.0
+    length: float | None = None
+
+
+@dataclass(frozen=True)
+class LayoutCheck:
+    """ Results of a fastener layout check.
+
+    Attributes
+    ----------
+    c_delta : float
+        Geometry factor, `CΔ`. Zero if any minimum is not met.
+    edge_distance, end_distance : float
+        Smallest edge and end distances in the pattern.
+    spacing, row_spacing : float
+        Smallest spacing between fasteners in a row and between rows.
+    clear_spacing : float
+        Smallest center to center distance between any two fasteners.
+    issues : tuple[str, ...]
+        Description of each requirement that is not met.
+    """
+    c_delta: float
+    edge_distance: float
+    end_distance: float
+    spacing: float
+    row_spacing: float
+    clear_spacing: float
+    issues: tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+
+def check_layout(
+    dowel: WoodDowel,
+    points: np.ndarray,
+    member: Member,
+    *,
+    theta: float = 0.0,
+    tension: bool = True,
+    softwood: bool = True,
+    loaded_edge: str | None = None,
+) -> LayoutCheck:
+    """ Check spacing, edge and end distance of a bolt pattern and compute `CΔ`.
+
+    Rows are taken parallel to the load. Fasteners are grouped into rows by
+    coordinate and sorted, and the nearest neighbor of every fastener is
+    found with a KD-tree, so the check is ``O(n log n)`` in the number of
+    fasteners.
+
+    For loads at an angle to grain, both the parallel and perpendicular to
+    grain requirements are checked and the smaller `CΔ` is used.
+
+    REF: NDS, 2015 - 12.5.1, Tables 12.5.1A-D
+
+    Parameters
+    ----------
+    dowel : WoodDowel
+        Fastener, `d` is used as the diameter and the lesser of `lm` and the
+        total side member length (`ls`, or ``2*ls`` in double shear) as the
+        length, `l`.
+    points : np.ndarray
+        Fastener coordinates, shape ``(n, 2)``.
+    member : Member
+        Member geometry.
+    theta : float, optional
+        Angle of dowel load relative to grain, by default 0.0.
+    tension : bool, optional
+        `True` if the parallel to grain load pulls fasteners toward the member
+        end, by default `True`.
+    softwood : bool, optional
+        By default `True`.
+    loaded_edge : str | None, optional
+        ``"top"`` (``y = width``) or ``"bottom"`` (``y = 0``), the edge the
+        perpendicular to grain load pushes toward. If `None`, both edges are
+        treated as loaded. By default `None`.
+
+    Returns
+    -------
+    LayoutCheck
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(points) == 0:
+        raise ValueError("No fastener coordinates given.")
+    x, y = points[:, 0], points[:, 1]
+    d = dowel.d
+    # Lesser of main member and total side member length.
+    ls_total = 2.0*dowel.ls if dowel.double_shear else dowel.ls
+    l_d = min(dowel.lm, ls_total)/d
+    issues = []
+
+    parallel = theta < 90.0
+    perpendicular = theta > 0.0
+
+    # Spacing in and between rows, for both load directions.
+    spacing_par, rows_par = _row_spacing(x, y, d)
+    spacing_perp, rows_perp = _row_spacing(y, x, d)
+    spacing = math.inf
+    row_spacing = math.inf
+    c_delta = 1.0
+
+    if parallel:
+        spacing = min(spacing, spacing_par)
+        row_spacing = min(row_spacing, rows_par)
+        # Table 12.5.1C, spacing in a row parallel to grain, 3D minimum, 4D full.
+        c_delta = min(c_delta, _factor(spacing_par, 3.0*d, 4.0*d))
+        if spacing_par < 3.0*d:
+            issues.append(f"Spacing in a row {spacing_par:#.3g}\" < 3D parallel to grain.")
+        # Table 12.5.1D, 1.5D between rows.
+        if rows_par < 1.5*d:
+            issues.append(f"Spacing between rows {rows_par:#.3g}\" < 1.5D parallel to grain.")
+
+    if perpendicular:
+        spacing = min(spacing, spacing_perp)
+        row_spacing = min(row_spacing, rows_perp)
+        # Table 12.5.1C, spacing in a row perpendicular to grain, 3D minimum.
+        if spacing_perp < 3.0*d:
+            issues.append(f"Spacing in a row {spacing_perp:#.3g}\" < 3D perpendicular to grain.")
+        # Table 12.5.1D, between rows depends on l/D.
+        if l_d <= 2.0:
+            rows_min = 2.5*d
+        elif l_d < 6.0:
+            rows_min = (5.0*l_d*d + 10.0*d)/8.0
+        else:
+            rows_min = 5.0*d
+        if rows_perp < rows_min:
+            issues.append(
+                f"Spacing between rows {rows_perp:#.3g}\" < {rows_min:#.3g}\" perpendicular to grain."
+            )
+
+    # Edge distance, Table 12.5.1A.
+    bottom, top = float(y.min()), float(member.width - y.max())
+    edge_distance = min(bottom, top)
+    if parallel:
+        edge_min = 1.5*d
+        if l_d > 6.0 and math.isfinite(rows_par):
+            edge_min = max(edge_min, rows_par/2.0)
+        if edge_distance < edge_min:
+            issues.append(f"Edge distance {edge_distance:#.3g}\" < {edge_min:#.3g}\".")
+    if perpendicular:
+        loaded = {"top": (top,), "bottom": (bottom,), None: (top, bottom)}[loaded_edge]
+        unloaded = {"top": (bottom,), "bottom": (top,), None: ()}[loaded_edge]
+        if min(loaded) < 4.0*d:
+            issues.append(f"Loaded edge distance {min(loaded):#.3g}\" < 4D.")
+        if unloaded and min(unloaded) < 1.5*d:
+            issues.append(f"Unloaded edge distance {min(unloaded):#.3g}\" < 1.5D.")
+
+    # End distance, Table 12.5.1B.
+    end_distance = float(x.min() - member.end)
+    if member.length is not None:
+        end_distance = min(end_distance, float(member.end + member.length - x.max()))
+    if parallel:
+        if not tension:
+            end_min, end_full = 2.0*d, 4.0*d
+        elif softwood:
+            end_min, end_full = 3.5*d, 7.0*d
+        else:
+            end_min, end_full = 2.5*d, 5.0*d
+        c_delta = min(c_delta, _factor(end_distance, end_min, end_full))
+        if end_distance < end_min:
+            issues.append(f"End distance {end_distance:#.3g}\" < {end_min/d:#.2g}D.")
+    if perpendicular:
+        c_delta = min(c_delta, _factor(end_distance, 2.0*d, 4.0*d))
+        if end_distance < 2.0*d:
+            issues.append(f"End distance {end_distance:#.3g}\" < 2D perpendicular to grain.")
+
+    # Nearest neighbor in any direction, catches staggered and coincident
+    # fasteners. No pair may be closer than the smallest spacing permitted above.
+    clear_min = 1.5*d if parallel else min(3.0*d, rows_min)
+    if len(points) > 1:
+        dist, _ = cKDTree(points).query(points, k=2)
+        clear_spacing = float(dist[:, 1].min())
+    else:
+        clear_spacing = math.inf
+    if clear_spacing < clear_min:
+        issues.append(f"Fasteners {clear_spacing:#.3g}\" apart, < {clear_min:#.3g}\".")
+
+    if issues:
+        c_delta = 0.0
+
+    return LayoutCheck(
+        c_delta=c_delta,
+        edge_distance=edge_distance,
+        end_distance=end_distance,
+        spacing=spacing,
+        row_spacing=row_spacing,
+        clear_spacing=clear_spacing,
+        issues=tuple(issues),
+    )
+
+
+def _row_spacing(
+    along: np.ndarray,
+    across: np.ndarray,
+    d: float,
+) -> tuple[float, float]:
+    """ Smallest spacing within rows running along `along`, and between rows.
+
+    Returns `inf` where there is only one fastener in every row, or one row.
+    """
+    tol = _ROW_TOL*d
+    row_key = np.round(across/tol).astype(np.int64)
+    order = np.lexsort((along, row_key))
+    along_sorted, key_sorted = along[order], row_key[order]
+
+    same_row = key_sorted[1:] == key_sorted[:-1]
+    gaps = np.diff(along_sorted)[same_row]
+    spacing = float(gaps.min()) if gaps.size else math.inf
+
+    # Row positions from the first fastener in each row.
+    first = np.flatnonzero(np.r_[True, ~same_row])
+    row_gaps = np.diff(across[order][first])
+    row_spacing = float(row_gaps.min()) if row_gaps.size else math.inf
+    return spacing, row_spacing
+
+
+def _factor(actual: float, minimum: float, full: float) -> float:
+    """ `CΔ` for one requirement, ``actual/full`` between `minimum` and `full`.
+    """
+    if actual >= full:
+        return 1.0
+    return max(actual, minimum)/full
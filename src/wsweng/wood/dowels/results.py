@@ -0,0 +1,192 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+_MANIFEST = "schema.json"
+_VERSION = 1
+
+
+class ResultStore:
+    """ Columnar on-disk store for large result sets.
+
+    A store is a directory holding one raw binary file per column plus a
+    ``schema.json`` manifest recording the column dtypes, optional labels for
+    coded columns and the number of committed rows. Columns are read by
+    memory-mapping, so reading a column does not copy it into memory.
+
+    ```text
+    results/
+        schema.json
+        d.bin
+        theta.bin
+        mode.bin
+        ...
+    ```
+
+    Rows are appended by writing every column file and then updating the
+    manifest, so an interrupted append never exposes partial rows.
+
+    Parameters
+    ----------
+    path : str | Path
+        Store directory.
+    schema : Mapping[str, str], optional
+        Column names mapped to numpy dtype strings. Required to create a new
+        store. If given for an existing store it must match.
+    labels : Mapping[str, Sequence[str]], optional
+        Labels for integer coded columns, e.g. ``{"mode": ("Im", ...)}``, so
+        `where` can filter by label.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        schema: Mapping[str, str] = None,
+        labels: Mapping[str, Any] = None,
+    ) -> None:
+        self.path = Path(path)
+        manifest_path = self.path.joinpath(_MANIFEST)
+        if manifest_path.exists():
+            with open(manifest_path) as f:
+                self._manifest = json.load(f)
+            if schema is not None and dict(schema) != self._manifest["columns"]:
+                raise ValueError(f"Schema does not match existing store at {self.path}.")
+        elif schema is None:
+            raise FileNotFoundError(f"No result store at {self.path}.")
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._manifest = {
+                "version": _VERSION,
+                "rows": 0,
+                "columns": dict(schema),
+                "labels": {k: list(v) for k, v in (labels or {}).items()},
+            }
+            for name in self.columns:
+                self._column_path(name).touch()
+            self._write_manifest()
+
+    def __len__(self) -> int:
+        return self._manifest["rows"]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.column(name)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """ Column names, in schema order.
+        """
+        return tuple(self._manifest["columns"])
+
+    @property
+    def labels(self) -> dict[str, list[str]]:
+        """ Labels for integer coded columns.
+        """
+        return self._manifest["labels"]
+
+    def column(self, name: str) -> np.ndarray:
+        """ Read-only, memory-mapped view of one column.
+
+        Parameters
+        ----------
+        name : str
+
+        Returns
+        -------
+        np.ndarray
+        """
+        dtype = np.dtype(self._manifest["columns"][name])
+        if len(self) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._column_path(name), dtype=dtype, mode="r", shape=(len(self),))
+
+    def append(self, batch: Mapping[str, np.ndarray]) -> None:
+        """ Append rows to the store.
+
+        Parameters
+        ----------
+        batch : Mapping[str, np.ndarray]
+            One equal length array per column in the schema.
+        """
+        if set(batch) != set(self.columns):
+            raise ValueError(f"Batch columns do not match store schema: {sorted(batch)}")
+        lengths = {len(values) for values in batch.values()}
+        if len(lengths) != 1:
+            raise ValueError("Batch columns have different lengths.")
+
+        rows = len(self)
+        for name, dtype in self._manifest["columns"].items():
+            dtype = np.dtype(dtype)
+            with open(self._column_path(name), "r+b") as f:
+                # Drop anything left by an interrupted append.
+                f.truncate(rows*dtype.itemsize)
+                f.seek(0, os.SEEK_END)
+                np.ascontiguousarray(batch[name], dtype=dtype).tofile(f)
+
+        self._manifest["rows"] = rows + lengths.pop()
+        self._write_manifest()
+
+    def where(
+        self,
+        predicate: Callable[["ResultStore"], np.ndarray] = None,
+        **equals: Any,
+    ) -> np.ndarray:
+        """ Indices of rows matching a predicate and/or column values.
+
+        Parameters
+        ----------
+        predicate : callable, optional
+            Called with the store, returns a boolean mask over the rows, e.g.
+            ``lambda s: s["zv"] > 1000.0``.
+        **equals
+            Column values to match. Labelled columns accept labels, e.g.
+            ``mode="IIIs"``.
+
+        Returns
+        -------
+        np.ndarray
+            Row indices, usable with `select`.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if predicate is not None:
+            mask &= predicate(self)
+        for name, value in equals.items():
+            if name in self.labels and isinstance(value, str):
+                value = self.labels[name].index(value)
+            mask &= self.column(name) == value
+        return np.flatnonzero(mask)
+
+    def select(
+        self,
+        rows: np.ndarray,
+        columns: tuple[str, ...] = None,
+    ) -> dict[str, np.ndarray]:
+        """ Copy the given rows out of the store.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Row indices or boolean mask.
+        columns : tuple[str, ...], optional
+            Columns to read, by default all.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+        """
+        return {name: self.column(name)[rows] for name in (columns or self.columns)}
+
+    # =========================
+    # =   PROTECTED METHODS   =
+    # =========================
+
+    def _column_path(self, name: str) -> Path:
+        return self.path.joinpath(f"{name}.bin")
+
+    def _write_manifest(self) -> None:
+        tmp_path = self.path.joinpath(_MANIFEST + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._manifest, f, indent=2)
+        os.replace(tmp_path, self.path.joinpath(_MANIFEST))
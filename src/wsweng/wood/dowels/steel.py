@@ -0,0 +1,126 @@
+from functools import lru_cache
+from typing import Any, Iterable
+
+import numpy as np
+
+from wsweng.data import load_yaml
+
+from .wood_dowel import WoodDowel
+from .dowel_factory import Dowels
+from .batch import dowel_arrays, evaluate
+
+# Limit states in the order reported by `steel_check`.
+LIMIT_STATES = ("wood", "bolt shear", "bearing")
+
+# ASD safety factor for bolt shear, tension and bearing.
+# REF: AISC 360-16 - J3.6, J3.10
+_OMEGA = 2.00
+
+
+@lru_cache(maxsize=None)
+def _steel_grades() -> dict[str, Any]:
+    return load_yaml("material.yaml")["STEEL"]["TYPE"]
+
+
+def steel_grade(grade: str) -> dict[str, Any]:
+    """ Properties of a steel grade in ``material.yaml``, e.g. ``"A36"``.
+
+    Parameters
+    ----------
+    grade : str
+
+    Returns
+    -------
+    dict[str, Any]
+        Including ``Fy`` and ``Fu``.
+    """
+    return _steel_grades()[grade]
+
+
+def steel_check(
+    dowels: Iterable[WoodDowel],
+    theta: float | Iterable[float] = 90.0,
+    *,
+    grade: str = "A36",
+) -> dict[str, np.ndarray]:
+    """ Combined wood yield limit and steel bolt/plate check.
+
+    Bolt strengths come from the catalog `FU` for the dowel diameter. Only
+    the A307 entries loaded by `Dowels` can be used; other diameters (e.g.
+    the 1-1/8" A325 in ``bolts.csv``) raise `KeyError`. The steel member is
+    whichever member has a bearing strength override (`fe_side` first, then
+    `fe_main`) and is taken as a plate of `grade`.
+    Dowels without a steel member only get the bolt shear check.
+
+    Steel capacities are ASD allowables, ``Rn/Ω``, compared against the wood
+    reference value `Zv` (no wood adjustment factors applied).
+
+    - Bolt shear, threads included: ``Rn = 0.45 Fu Ab`` per shear plane.
+    - Bolt tension: ``Rn = 0.75 Fu Ab``, reported only.
+    - Bearing on the plate: ``Rn = 2.4 d t Fu`` per plate, two side
+      plates in double shear.
+
+    REF: AISC 360-16 - J3.6, J3.10, Table J3.2
+
+    Parameters
+    ----------
+    dowels : Iterable[WoodDowel]
+        Dowels with A307 catalog bolt diameters.
+    theta : float | Iterable[float], optional
+        Angle(s) of dowel load relative to grain, by default 90.0.
+    grade : str, optional
+        Steel grade of the plate, by default `A36`.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        One row per dowel and angle (dowel major), with columns ``theta``,
+        ``zv``, ``shear``, ``tension``, ``bearing``, ``capacity`` (the least
+        of `zv`, `shear` and `bearing`) and ``governs`` (index into
+        `LIMIT_STATES`).
+    """
+    dowels = list(dowels)
+    inputs = dowel_arrays(dowels)
+    wood = evaluate(dowels, theta)
+    n_theta = len(wood["zv"])//max(len(dowels), 1)
+
+    # Bolt ultimate strength from the catalog.
+    catalog = Dowels._catalog()
+    catalog_d = catalog["D"].to_numpy()
+    d = inputs["d"]
+    index = np.searchsorted(catalog_d, d).clip(max=len(catalog_d) - 1)
+    missing = ~np.isclose(catalog_d[index], d)
+    if missing.any():
+        raise KeyError(f"Bolt diameters not in catalog: {np.unique(d[missing])}")
+    fu_bolt = catalog["FU"].to_numpy()[index]
+
+    fu_plate = steel_grade(grade)["Fu"]
+    double_shear = inputs["double_shear"]
+    area = np.pi*d**2/4.0
+
+    shear = np.where(double_shear, 2.0, 1.0)*0.45*fu_bolt*area/_OMEGA
+    tension = 0.75*fu_bolt*area/_OMEGA
+
+    side_steel = ~np.isnan(inputs["fe_side"])
+    main_steel = ~side_steel & ~np.isnan(inputs["fe_main"])
+    plate_t = np.where(
+        side_steel, np.where(double_shear, 2.0, 1.0)*inputs["ls"],
+        np.where(main_steel, inputs["lm"], np.inf)
+    )
+    bearing = 2.4*d*plate_t*fu_plate/_OMEGA
+
+    limits = np.stack((
+        wood["zv"],
+        np.repeat(shear, n_theta),
+        np.repeat(bearing, n_theta),
+    ))
+    governs = np.argmin(limits, axis=0)
+    return {
+        "theta": wood["theta"],
+        "zv": wood["zv"],
+        "shear": limits[1],
+        "tension": np.repeat(tension, n_theta),
+        "bearing": limits[2],
+        "capacity": np.take_along_axis(limits, governs[None, :], axis=0)[0],
+        "governs": governs.astype(np.int8),
+    }
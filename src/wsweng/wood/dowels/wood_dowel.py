@@ -1,8 +1,75 @@
 from cmath import nan
-from dataclasses import dataclass, KW_ONLY
-from functools import cached_property
+from dataclasses import dataclass, field, fields, KW_ONLY
+from functools import cached_property, wraps
 import math
 
+# Calculated quantities mapped to what they are computed from. Entries are
+# either dataclass fields or other quantities in this table. Used by
+# `WoodDowel.derive` to decide which cached values a variant can reuse.
+_DEPENDS = {
+    "de": {"d", "dr", "full_diameter"},
+    "rt": {"lm", "ls"},
+    "kd": {"de"},
+    "fem": {"d", "gm", "fe_main"},
+    "fes": {"d", "gs", "fe_side"},
+    "re": {"fem", "fes"},
+    "k1": {"re", "rt"},
+    "k2": {"re", "fem", "de", "fyb", "lm"},
+    "k3": {"re", "fem", "de", "fyb", "ls"},
+    "zim": {"de", "kd", "lm", "fem"},
+    "zis": {"de", "kd", "ls", "fes"},
+    "zii": {"k1", "de", "kd", "ls", "fes"},
+    "ziiim": {"k2", "de", "kd", "lm", "fem", "re"},
+    "ziiis": {"k3", "de", "kd", "ls", "fem", "re"},
+    "ziv": {"fem", "fyb", "re", "de", "kd"},
+}
+
+
+def _resolve(name: str) -> frozenset[str]:
+    """ Reduce a quantity in `_DEPENDS` to the dataclass fields it uses.
+    """
+    ret = set()
+    for dep in _DEPENDS[name]:
+        if dep in _DEPENDS:
+            ret |= _resolve(dep)
+        else:
+            ret.add(dep)
+    return frozenset(ret)
+
+
+_FIELD_DEPENDS = {name: _resolve(name) for name in _DEPENDS}
+
+# Attributes `WoodDowel.__post_init__` fills from another when not given.
+_DEFAULTED_FROM = {"dr": "d", "pt": "lm"}
+
+# Angles kept per quantity in ``WoodDowel._memo`` before its table is cleared.
+_MEMO_LIMIT = 128
+
+
+def _memoized(method):
+    """ Cache an angle dependent quantity in ``self._memo[name][theta]``.
+
+    Each quantity's table is cleared once it holds `_MEMO_LIMIT` angles, so a
+    long lived dowel swept over many angles does not grow without bound.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, theta: float = 90.0) -> float:
+        table = self._memo.get(name)
+        if table is None:
+            table = self._memo.setdefault(name, {})
+        try:
+            return table[theta]
+        except KeyError:
+            value = method(self, theta)
+            if len(table) >= _MEMO_LIMIT:
+                table.clear()
+            table[theta] = value
+            return value
+
+    return wrapper
+
 
 @dataclass(frozen=True)
 class WoodDowel:
@@ -37,6 +104,12 @@ class WoodDowel:
     double_shear : bool
         `False` if only one side member is fastened to the main member. `True` if a side member is
         connected either side by the same fastener. Defaults to `False`.
+
+    Notes
+    -----
+    Instances may be shared between threads. Calculated values are cached on
+    first use, but each is a pure function of the attributes, so two threads
+    racing on the same value at worst both compute it and store equal results.
     """
     d: float
     _: KW_ONLY
@@ -52,16 +125,23 @@ class WoodDowel:
     fe_side: float | None = None
     full_diameter: bool = False
     double_shear: bool = False
+    _memo: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _defaulted: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """ Update any missing defaults.
         """
+        defaulted = set()
         if self.dr is None:
             object.__setattr__(self, "dr", self.d)
             object.__setattr__(self, "full_diameter", True)
+            defaulted.add("dr")
 
         if self.pt is None:
             object.__setattr__(self, "pt", self.lm)
+            defaulted.add("pt")
+
+        object.__setattr__(self, "_defaulted", frozenset(defaulted))
 
     def Zv(self, theta: float = 90.0) -> float:
         """ Reference dowel shear capacity.
@@ -92,6 +172,82 @@ class WoodDowel:
                 self.ziv(theta),
             )
 
+    def derive(self, **changes) -> "WoodDowel":
+        """ Create a variant of this dowel with some attributes changed.
+
+        Unlike ``dataclasses.replace``, any intermediates already computed on
+        this dowel that do not depend on the changed attributes (e.g. `fem`
+        and `fes` when only `lm` changes) are carried over to the new dowel
+        instead of being recomputed. Attributes that were defaulted from
+        another (`pt` from `lm`, `dr` from `d`) and not given in `changes`
+        are defaulted again if that attribute changes.
+
+        Parameters
+        ----------
+        **changes
+            Attributes to change, as passed to ``dataclasses.replace``.
+
+        Returns
+        -------
+        WoodDowel
+        """
+        unknown = changes.keys() - _AFFECTS.keys()
+        if unknown:
+            raise TypeError(f"Unknown WoodDowel attributes: {sorted(unknown)}")
+
+        # Filled in directly rather than through ``replace``, which costs as
+        # much as the intermediates it would let us skip.
+        state = self.__dict__
+        derived = object.__new__(WoodDowel)
+        values = derived.__dict__
+        for name in _AFFECTS:
+            values[name] = state[name]
+        values.update(changes)
+
+        defaulted = self._defaulted - changes.keys()
+        for name, source in _DEFAULTED_FROM.items():
+            if values[name] is None or (name in defaulted and source in changes):
+                values[name] = values[source]
+                defaulted |= {name}
+                if name == "dr":
+                    values["full_diameter"] = True
+        values["_defaulted"] = defaulted
+
+        stale = set()
+        for name in (*changes, "dr", "pt", "full_diameter"):
+            if values[name] != state[name]:
+                stale |= _AFFECTS[name]
+
+        # Cached properties live in the instance dict.
+        for name in ("de", "rt", "kd"):
+            if name in state and name not in stale:
+                values[name] = state[name]
+
+        # Angle dependent quantities, tables are shared with this dowel.
+        values["_memo"] = {
+            name: table for name, table in self._memo.copy().items()
+            if name not in stale
+        }
+        return derived
+
+    @staticmethod
+    def affected(changed: set[str]) -> set[str]:
+        """ Calculated quantities that depend on any of the attributes in `changed`.
+
+        Parameters
+        ----------
+        changed : set[str]
+            Names of dowel attributes, e.g. ``{"lm"}``.
+
+        Returns
+        -------
+        set[str]
+        """
+        ret = set()
+        for name in changed:
+            ret |= _AFFECTS[name]
+        return ret
+
     def Zw(self) -> float:
         """ Reference dowel withdrawl capacity.
 
@@ -157,6 +313,7 @@ class WoodDowel:
     # =   Dowel Mode Equations   =
     # ============================
 
+    @_memoized
     def zim(self, theta: float = 90.0) -> float:
         """_summary_
 
@@ -172,6 +329,7 @@ class WoodDowel:
         # ZIM = D * LM * FEM / RD(D, Theta, 4#)
         return self.de*self.lm*self.fem(theta)/self.rd(4.0, theta)
 
+    @_memoized
     def zis(self, theta: float = 90.0) -> float:
         """_summary_
 
@@ -187,6 +345,7 @@ class WoodDowel:
         # ZIS = D * LS * FES / RD(D, Theta, 4#)
         return self.de*self.ls*self.fes(theta)/self.rd(4.0, theta)
 
+    @_memoized
     def zii(self, theta: float = 90.0) -> float:
         """_summary_
 
@@ -202,6 +361,7 @@ class WoodDowel:
         # ZII = k1 * D * LS * FES / RD(D, Theta, 3.6)
         return self.k1(theta)*self.de*self.ls*self.fes(theta)/self.rd(3.6, theta)
 
+    @_memoized
     def ziiim(self, theta: float = 90.0) -> float:
         """_summary_
 
@@ -220,6 +380,7 @@ class WoodDowel:
             ((1 + 2*self.re(theta))*self.rd(3.2, theta))
         )
 
+    @_memoized
     def ziiis(self, theta: float = 90.0) -> float:
         """_summary_
 
@@ -238,6 +399,7 @@ class WoodDowel:
             ((2 + self.re(theta))*self.rd(3.2, theta))
         )
 
+    @_memoized
     def ziv(self, theta: float = 90.0) -> float:
         """_summary_
 
@@ -276,6 +438,7 @@ class WoodDowel:
         # KTheta = 1 + 0.25 * (Theta / 90)
         return 1.0 + 0.25*(theta/90)
 
+    @_memoized
     def k1(self, theta: float = 90.0) -> float:
         """ constant K1.
 
@@ -303,6 +466,7 @@ class WoodDowel:
         #     k1_ = k1_ / (1 + RE)
         return k1/(1 + _re)
 
+    @_memoized
     def k2(self, theta: float = 90.0) -> float:
         """ Constant K2.
 
@@ -329,6 +493,7 @@ class WoodDowel:
         #     k2_ = Math.Sqr(k2_) - 1
         return math.sqrt(k2) - 1
 
+    @_memoized
     def k3(self, theta: float = 90.0) -> float:
         """ Constant K3.
 
@@ -355,6 +520,7 @@ class WoodDowel:
         #     k3_ = Math.Sqr(k3_) - 1
         return math.sqrt(k3) - 1
 
+    @_memoized
     def fem(self, theta: float = 90.0) -> float:
         """ Compute effective main member bearing strength.
 
@@ -372,6 +538,7 @@ class WoodDowel:
         else:
             return self.fe_main
 
+    @_memoized
     def fes(self, theta: float = 90.0) -> float:
         """ Compute effective side member bearing strength.
 
@@ -423,6 +590,7 @@ class WoodDowel:
                 )
             )
 
+    @_memoized
     def re(self, theta: float) -> float:
         """ Ratio of main member to side member bearing stress.
 
@@ -494,3 +662,10 @@ class WoodDowel:
 
     def _repr_markdown_(self) -> str:
         return(self._MARKDOWN_REPR.format(**self._collect_args()))
+
+
+# Calculated quantities that depend on each attribute, see `WoodDowel.derive`.
+_AFFECTS = {
+    f.name: frozenset(name for name, deps in _FIELD_DEPENDS.items() if f.name in deps)
+    for f in fields(WoodDowel) if f.init
+}
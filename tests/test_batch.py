@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from wsweng.wood.dowels import Dowels, evaluate, precision_report
+
+
+def test_evaluate_float32_dtypes():
+    dowels = [Dowels.bolt(0.5, tm=3.5, ts=1.5, double_shear=True)]
+    result = evaluate(dowels, (0.0, 90.0), dtype=np.float32)
+    assert result["zv"].dtype == np.float32
+    assert result["mode"].dtype == np.int8
+    np.testing.assert_allclose(result["zv"], [d.Zv(t) for d in dowels for t in (0.0, 90.0)],
+                               rtol=1e-6)
+
+
+def test_precision_report_breakdown():
+    report = precision_report(thicknesses=(0.25, 1.5, 5.5), angles=(0.0, 45.0, 90.0))
+    rows, by_group = report["rows"], report["by_group"]
+    assert len(rows) == report["points"]
+    assert report["max_rel_error"] == pytest.approx(rows["rel_error"].max())
+    assert report["max_rel_error"] < 1e-5
+    assert by_group.index.names == ["d", "lm", "ls", "double_shear"]
+    assert by_group["max_rel_error"].max() == report["max_rel_error"]
+    assert by_group.loc[(0.5, 1.5, 1.5, True), "max_rel_error"] < 1e-5
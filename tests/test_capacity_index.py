@@ -0,0 +1,43 @@
+import pytest
+
+from wsweng.wood.dowels import CapacityIndex, Dowels
+from wsweng.wood.dowels import dowel_factory
+
+
+@pytest.fixture(scope="module")
+def index():
+    return CapacityIndex(thicknesses=(1.5, 3.5), angles=(0.0, 90.0))
+
+
+def test_query_matches_zv(index):
+    result = index.query(1000.0, tm=3.5, ts=1.5, theta=0.0)
+    assert len(result["id"])
+    assert list(result["d"]) == sorted(result["d"])
+    for d, double_shear, zv in zip(result["d"], result["double_shear"], result["zv"]):
+        dowel = Dowels.bolt(d, tm=3.5, ts=1.5, double_shear=bool(double_shear))
+        assert zv == pytest.approx(dowel.Zv(0.0))
+        assert zv >= 1000.0
+
+
+def test_query_rejects_bad_sort(index):
+    with pytest.raises(ValueError):
+        index.query(1000.0, tm=3.5, ts=1.5, sort="name")
+    with pytest.raises(ValueError):
+        index.query(1000.0, tm=3.5, ts=1.5, sort="cost")
+
+
+def test_rebuild_on_material_change(index, monkeypatch):
+    before = index.query(0.0, tm=3.5, ts=1.5, theta=90.0, sort="zv")["zv"]
+    monkeypatch.setitem(dowel_factory._MATERIALS, "DFL", {"G": 0.55})
+    after = index.query(0.0, tm=3.5, ts=1.5, theta=90.0, sort="zv")["zv"]
+    assert (after > before).all()
+
+
+def test_reload_stale_catalog(monkeypatch):
+    catalog = Dowels._catalog()
+    # As if bolts.csv changed after the catalog was loaded.
+    monkeypatch.setattr(Dowels, "_bolts", catalog.iloc[:1])
+    monkeypatch.setattr(Dowels, "_bolts_stamp", (0, 0))
+    index = CapacityIndex(thicknesses=(3.5,), angles=(90.0,))
+    result = index.query(0.0, tm=3.5, ts=3.5, theta=90.0)
+    assert set(result["id"]) == set(catalog.index)
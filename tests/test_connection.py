@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from wsweng.wood.dowels import Connection, Dowels, Ply, evaluate_connections
+
+THETAS = (0.0, 30.0, 90.0)
+
+
+def test_two_plies_is_single_shear():
+    connection = Connection.bolt(0.5, [Ply(3.5), Ply(1.5)])
+    dowel = Dowels.bolt(0.5, tm=3.5, ts=1.5)
+    for theta in THETAS:
+        assert connection.Zv(theta) == pytest.approx(dowel.Zv(theta))
+
+
+def test_three_plies_is_double_shear():
+    connection = Connection.bolt(0.5, [Ply(1.5), Ply(3.5), Ply(1.5)])
+    dowel = Dowels.bolt(0.5, tm=3.5, ts=1.5, double_shear=True)
+    assert connection.Zv(90.0) == pytest.approx(dowel.Zv(90.0))
+    assert connection.Zv(90.0) == pytest.approx(470.3, abs=0.1)
+
+
+def test_three_plies_unequal_sides():
+    connection = Connection.bolt(
+        0.625, [Ply(0.25, material="A36"), Ply(5.5), Ply(1.5)]
+    )
+    steel = Dowels.bolt(0.625, tm=5.5, ts=0.25, material=("DFL", "A36"), double_shear=True)
+    wood = Dowels.bolt(0.625, tm=5.5, ts=1.5, double_shear=True)
+    assert connection.Zv(0.0) == pytest.approx(min(steel.Zv(0.0), wood.Zv(0.0)))
+
+
+def test_four_plies_per_plane():
+    # Interior plies contribute half their thickness to each plane.
+    connection = Connection.bolt(0.75, [Ply(1.5), Ply(3.5), Ply(3.5), Ply(1.5)])
+    outer = Dowels.bolt(0.75, tm=1.5, ts=1.75)
+    inner = Dowels.bolt(0.75, tm=1.75, ts=1.75)
+    expected = 3*min(outer.Zv(0.0), inner.Zv(0.0))
+    assert connection.Zv(0.0) == pytest.approx(expected)
+
+
+def test_evaluate_connections_matches_zv():
+    connections = [
+        Connection.bolt(0.5, [Ply(3.5), Ply(1.5)]),
+        Connection.bolt(0.5, [Ply(1.5), Ply(3.5), Ply(1.5)]),
+        Connection.bolt(0.625, [Ply(0.25, material="A36"), Ply(5.5), Ply(1.5)]),
+        Connection.bolt(0.75, [Ply(1.5), Ply(3.5), Ply(3.5), Ply(1.5)]),
+        Connection.bolt(0.75, [Ply(1.5)]*5),
+    ]
+    result = evaluate_connections(connections, THETAS)
+    expected = [c.Zv(theta) for c in connections for theta in THETAS]
+    np.testing.assert_allclose(result["zv"], expected)
+
+
+def test_evaluate_no_connections():
+    result = evaluate_connections([], THETAS)
+    assert all(len(values) == 0 for values in result.values())
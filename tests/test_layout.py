@@ -0,0 +1,82 @@
+import pytest
+
+from wsweng.wood.dowels import Dowels, Member, check_layout
+
+
+@pytest.fixture
+def bolt():
+    # D = 0.75"
+    return Dowels.bolt(0.75, tm=5.5, ts=1.5)
+
+
+def test_parallel_full_geometry(bolt):
+    # End 7D, spacing 4D, edge 2.75" > 1.5D.
+    check = check_layout(bolt, [(5.25, 2.75), (8.25, 2.75)], Member(5.5))
+    assert check.ok
+    assert check.c_delta == 1.0
+    assert check.end_distance == 5.25
+    assert check.spacing == 3.0
+
+
+def test_parallel_reduced_end_distance(bolt):
+    # Tension, softwood: end 3.5" between 3.5D (2.625") and 7D (5.25").
+    check = check_layout(bolt, [(3.5, 2.75), (6.5, 2.75)], Member(5.5))
+    assert check.ok
+    assert check.c_delta == pytest.approx(3.5/5.25)
+
+
+def test_parallel_reduced_spacing(bolt):
+    # Spacing 3.5D = 2.625" between 3D and 4D, CΔ = 2.625/3.0.
+    check = check_layout(bolt, [(5.25, 2.75), (7.875, 2.75)], Member(5.5))
+    assert check.ok
+    assert check.c_delta == pytest.approx(0.875)
+
+
+def test_parallel_compression_end_distance(bolt):
+    # Compression: 2D minimum, 4D full. End 2.25" = 3D.
+    check = check_layout(bolt, [(2.25, 2.75)], Member(5.5), tension=False)
+    assert check.c_delta == pytest.approx(0.75)
+
+
+def test_perpendicular_full_geometry(bolt):
+    # Row across grain, 4D spacing, end 4.0" > 4D, loaded edge 3.0" = 4D.
+    check = check_layout(
+        bolt, [(4.0, 3.0), (4.0, 6.0)], Member(9.0), theta=90.0, loaded_edge="bottom"
+    )
+    assert check.ok
+    assert check.c_delta == 1.0
+
+
+def test_perpendicular_reduced_end_distance(bolt):
+    # End 2.25" = 3D, between 2D and 4D.
+    check = check_layout(
+        bolt, [(2.25, 3.0), (2.25, 6.0)], Member(9.0), theta=90.0, loaded_edge="bottom"
+    )
+    assert check.ok
+    assert check.c_delta == pytest.approx(0.75)
+
+
+def test_perpendicular_loaded_edge_fails(bolt):
+    # Loaded edge 2.0" < 4D = 3.0".
+    check = check_layout(
+        bolt, [(4.0, 2.0), (4.0, 5.0)], Member(9.0), theta=90.0, loaded_edge="bottom"
+    )
+    assert not check.ok
+    assert check.c_delta == 0.0
+    assert any("Loaded edge" in issue for issue in check.issues)
+
+
+def test_row_spacing_uses_total_side_length():
+    # D = 0.5", rows 2.0" apart perpendicular to grain.
+    # Single shear: l = 1.5", l/D = 3, minimum (5l + 10D)/8 = 1.5625".
+    # Double shear: l = min(3.5, 2*1.5) = 3.0", l/D = 6, minimum 5D = 2.5".
+    points = [(4.0, 3.0), (6.0, 3.0)]
+    single = Dowels.bolt(0.5, tm=3.5, ts=1.5)
+    double = Dowels.bolt(0.5, tm=3.5, ts=1.5, double_shear=True)
+    assert check_layout(single, points, Member(6.0), theta=90.0, loaded_edge="bottom").ok
+    assert not check_layout(double, points, Member(6.0), theta=90.0, loaded_edge="bottom").ok
+
+
+def test_no_points(bolt):
+    with pytest.raises(ValueError):
+        check_layout(bolt, [], Member(5.5))
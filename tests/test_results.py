@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from wsweng.wood.dowels import Dowels, ResultStore, evaluate, evaluate_to_store
+from wsweng.wood.dowels.batch import MODES, schema
+
+THETAS = (0.0, 45.0, 90.0)
+
+
+@pytest.fixture
+def dowels():
+    return [
+        Dowels.bolt(d, tm=tm, ts=ts, material=material, double_shear=double_shear)
+        for d in (0.5, 0.75)
+        for tm, ts in ((3.5, 1.5), (5.5, 0.25))
+        for material in ("DFL", ("DFL", "A36"))
+        for double_shear in (False, True)
+    ]
+
+
+def test_append_to_reopened_store(tmp_path, dowels):
+    first = evaluate(dowels[:5], THETAS)
+    second = evaluate(dowels[5:], THETAS)
+    store = ResultStore(tmp_path, schema=schema(), labels={"mode": MODES})
+    store.append(first)
+
+    store = ResultStore(tmp_path)
+    assert len(store) == len(first["zv"])
+    store.append(second)
+
+    store = ResultStore(tmp_path, schema=schema())
+    assert len(store) == len(first["zv"]) + len(second["zv"])
+    assert store.labels == {"mode": list(MODES)}
+    for name in store.columns:
+        np.testing.assert_array_equal(store[name], np.concatenate((first[name], second[name])))
+
+
+def test_schema_mismatch(tmp_path):
+    ResultStore(tmp_path, schema=schema())
+    with pytest.raises(ValueError):
+        ResultStore(tmp_path, schema=schema(np.float32))
+    with pytest.raises(FileNotFoundError):
+        ResultStore(tmp_path.joinpath("missing"))
+
+
+def test_where(tmp_path, dowels):
+    expected = evaluate(dowels, THETAS)
+    store = evaluate_to_store(dowels, tmp_path, THETAS)
+
+    iiis = np.flatnonzero(expected["mode"] == MODES.index("IIIs"))
+    assert len(iiis)
+    np.testing.assert_array_equal(store.where(mode="IIIs"), iiis)
+
+    strong = np.flatnonzero(expected["zv"] > 1000.0)
+    assert 0 < len(strong) < len(store)
+    np.testing.assert_array_equal(store.where(lambda s: s["zv"] > 1000.0), strong)
+
+    both = store.where(lambda s: s["zv"] > 1000.0, mode="IIIs")
+    np.testing.assert_array_equal(both, np.intersect1d(iiis, strong))
+    np.testing.assert_array_equal(store.select(both, ("zv",))["zv"], expected["zv"][both])
+
+
+def test_chunked_matches_evaluate(tmp_path, dowels):
+    expected = evaluate(dowels, THETAS)
+    store = evaluate_to_store(iter(dowels), tmp_path, THETAS, chunk_size=3)
+    assert len(store) == len(expected["zv"])
+    for name in store.columns:
+        np.testing.assert_array_equal(store[name], expected[name])
+
+
+def test_append_drops_partial_write(tmp_path, dowels):
+    first = evaluate(dowels[:2], THETAS)
+    second = evaluate(dowels[2:4], THETAS)
+    store = ResultStore(tmp_path, schema=schema(), labels={"mode": MODES})
+    store.append(first)
+
+    # An append interrupted before the manifest was updated.
+    with open(store._column_path("zv"), "ab") as f:
+        f.write(b"\xff"*13)
+    store = ResultStore(tmp_path)
+    assert len(store) == len(first["zv"])
+
+    store.append(second)
+    for name in store.columns:
+        np.testing.assert_array_equal(store[name], np.concatenate((first[name], second[name])))
@@ -0,0 +1,41 @@
+import math
+
+import numpy as np
+import pytest
+
+from wsweng.wood.dowels import Dowels, WoodDowel, steel_check
+
+
+def test_half_inch_a307_double_shear_a36_plates():
+    # 1/2" A307 (Fu = 58 ksi), 3-1/2" DFL main, two 1/4" A36 plates (Fu = 58 ksi).
+    dowel = Dowels.bolt(0.5, tm=3.5, ts=0.25, material=("DFL", "A36"), double_shear=True)
+    result = steel_check([dowel], (0.0, 90.0))
+
+    area = math.pi*0.5**2/4.0                       # 0.1963 in^2
+    shear = 2*0.45*58.0e3*area/2.0                  # 5,125 lb, two planes
+    tension = 0.75*58.0e3*area/2.0                  # 4,271 lb
+    bearing = 2.4*0.5*(2*0.25)*58.0e3/2.0           # 17,400 lb, two plates
+
+    np.testing.assert_allclose(result["shear"], [shear, shear])
+    np.testing.assert_allclose(result["tension"], [tension, tension])
+    np.testing.assert_allclose(result["bearing"], [bearing, bearing])
+    np.testing.assert_allclose(result["zv"], [dowel.Zv(0.0), dowel.Zv(90.0)])
+    np.testing.assert_allclose(result["capacity"], result["zv"])
+    assert list(result["governs"]) == [0, 0]
+
+
+def test_bolt_shear_governs():
+    # Steel on steel with a very strong dowel, so bolt shear is lowest.
+    dowel = WoodDowel(
+        0.5, dr=0.406, lm=10.0, ls=10.0, fyb=1.0e6,
+        fe_main=87.0e3, fe_side=87.0e3, double_shear=True,
+    )
+    result = steel_check([dowel])
+    assert result["governs"][0] == 1
+    assert result["capacity"][0] == pytest.approx(2*0.45*58.0e3*math.pi*0.5**2/4.0/2.0)
+
+
+def test_non_a307_diameter():
+    dowel = WoodDowel(1.125, lm=5.5, ls=1.5)
+    with pytest.raises(KeyError):
+        steel_check([dowel])
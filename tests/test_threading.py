@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import numpy as np
+import pytest
+
+from wsweng.wood.dowels import Dowels, evaluate
+from wsweng.wood.dowels import dowel_factory
+
+DIAMETERS = (0.25, 0.3125, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0)
+THETAS = tuple(range(0, 91, 5))
+N_THREADS = 16
+
+
+def test_concurrent_factory_and_zv(monkeypatch):
+    shared = Dowels.bolt(0.75, tm=5.5, ts=1.5)
+    expected = {theta: shared.derive().Zv(theta) for theta in THETAS}
+    single = {d: Dowels.bolt(d, tm=3.5, ts=1.5).Zv(45) for d in DIAMETERS}
+
+    # Cold catalog, counting loads.
+    loads = []
+    load_bolts = dowel_factory._load_bolts
+
+    def counting_load():
+        loads.append(None)
+        return load_bolts()
+
+    monkeypatch.setattr(dowel_factory, "_load_bolts", counting_load)
+    monkeypatch.setattr(Dowels, "_bolts", None)
+    barrier = threading.Barrier(N_THREADS)
+
+    def work(i: int) -> None:
+        barrier.wait()
+        for j in range(200):
+            d = DIAMETERS[(i + j) % len(DIAMETERS)]
+            assert Dowels.bolt(d, tm=3.5, ts=1.5).Zv(45) == single[d]
+            theta = THETAS[(i*j) % len(THETAS)]
+            assert shared.Zv(theta) == expected[theta]
+
+    with ThreadPoolExecutor(N_THREADS) as pool:
+        list(pool.map(work, range(N_THREADS)))
+
+    assert len(loads) == 1
+
+
+def test_threaded_evaluate_matches_serial():
+    dowels = [
+        Dowels.bolt(d, tm=tm, ts=1.5)
+        for d in DIAMETERS for tm in np.linspace(1.0, 10.0, 200)
+    ]
+    serial = evaluate(dowels, THETAS)
+    threaded = evaluate(dowels, THETAS, workers=4, chunk_size=1000)
+    assert serial.keys() == threaded.keys()
+    for name in serial:
+        np.testing.assert_array_equal(serial[name], threaded[name])
+
+
+def test_evaluate_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        evaluate([Dowels.bolt(0.5, tm=3.5, ts=1.5)], workers=2, chunk_size=0)
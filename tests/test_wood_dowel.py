@@ -0,0 +1,67 @@
+from dataclasses import replace
+
+import pytest
+
+from wsweng.wood.dowels import Dowels, WoodDowel
+
+THETAS = (0.0, 30.0, 45.0, 90.0)
+
+CHANGES = [
+    {"d": 0.625},
+    {"dr": 0.45},
+    {"gm": 0.43},
+    {"gs": 0.55},
+    {"fyb": 60.0e3},
+    {"lm": 5.5},
+    {"ls": 2.5},
+    {"w": 300.0},
+    {"pt": 2.0},
+    {"fe_main": 87.0e3},
+    {"fe_side": 87.0e3},
+    {"full_diameter": True},
+    {"double_shear": True},
+]
+
+
+@pytest.fixture
+def dowel() -> WoodDowel:
+    dowel = Dowels.bolt(0.5, tm=3.5, ts=1.5)
+    for theta in THETAS:
+        dowel.Zv(theta)
+    return dowel
+
+
+@pytest.mark.parametrize("changes", CHANGES, ids=lambda c: next(iter(c)))
+def test_derive_matches_replace(dowel, changes):
+    derived = dowel.derive(**changes)
+    replaced = replace(dowel, **changes)
+    for theta in THETAS:
+        assert derived.Zv(theta) == replaced.Zv(theta)
+
+
+def test_derive_reuses_unaffected(dowel):
+    derived = dowel.derive(lm=5.5)
+    assert 90.0 in derived._memo["fem"]
+    assert "ziiim" not in derived._memo
+
+
+def test_derive_rejects_unknown(dowel):
+    with pytest.raises(TypeError):
+        dowel.derive(tm=5.5)
+
+
+def test_derive_redefaults_pt():
+    dowel = WoodDowel(0.5, lm=3.5)
+    assert dowel.derive(lm=5.5).pt == 5.5
+    assert dowel.derive(lm=5.5, pt=2.0).pt == 2.0
+    assert WoodDowel(0.5, lm=3.5, pt=2.0).derive(lm=5.5).pt == 2.0
+    # Still defaulted after a derive that did not touch it.
+    assert dowel.derive(gm=0.4).derive(lm=5.5).pt == 5.5
+    assert dowel.derive(gm=0.4).derive(d=0.75).dr == 0.75
+    assert dowel.derive(pt=2.0).derive(lm=5.5).pt == 2.0
+
+
+def test_memo_is_bounded(dowel):
+    for i in range(5000):
+        dowel.Zv(i/100.0)
+    assert all(len(table) <= 128 for table in dowel._memo.values())